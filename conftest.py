@@ -26,20 +26,32 @@ import logging
 from dataclasses import dataclass
 
 import numpy as np
+from scipy import stats
 
 from d8analysis.container import D8AnalysisContainer
 from d8analysis.data.dataclass import DataClass
+from d8analysis.service.io import IOService
+from tests._banner import log_start, log_end
 
-# ------------------------------------------------------------------------------------------------ #
-logging.getLogger("matplotlib").setLevel(logging.WARNING)
 # ------------------------------------------------------------------------------------------------ #
 DATAFILE = "data/Credit Score Classification Dataset.csv"
 RESET_SCRIPT = "tests/scripts/reset.sh"
+PROFILES = "config/stats.yml"
+SEED = 20230527
 
 # ------------------------------------------------------------------------------------------------ #
 collect_ignore_glob = []
 
 
+# ------------------------------------------------------------------------------------------------ #
+#                                   LOGGING CONFIGURATION                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Logging is configured once per pytest process, including each pytest-xdist worker, rather than
+# as a side effect of importing conftest or a test module.
+def pytest_configure(config):
+    logging.getLogger("matplotlib").setLevel(logging.WARNING)
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                                      DATACLASS                                                   #
 # ------------------------------------------------------------------------------------------------ #
@@ -54,6 +66,23 @@ class TestDataClass(DataClass):
     # somedict: dict = field(default=lambda: {"some": 2, "dict": "yeah"})
 
 
+# ------------------------------------------------------------------------------------------------ #
+#                                     TEST BANNERS                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# Banners are logged from the reporting hooks so that they stay out of the test bodies and out of
+# the measured call phase. The domain, e.g. "TestKSTest.test_kstest", names the test.
+banner_logger = logging.getLogger("tests")
+
+
+def pytest_runtest_logstart(nodeid, location):
+    log_start(banner_logger, location[2])
+
+
+def pytest_runtest_logreport(report):
+    if report.when == "call":
+        log_end(banner_logger, report.location[2], round(report.duration, 3))
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                                   RESET TEST DB                                                  #
 # ------------------------------------------------------------------------------------------------ #
@@ -65,19 +94,26 @@ def reset():
 # ------------------------------------------------------------------------------------------------ #
 #                                  SET MODE TO TEST                                                #
 # ------------------------------------------------------------------------------------------------ #
-@pytest.fixture(scope="module", autouse=True)
+# Under pytest-xdist each worker sets its own environment, but only the first worker (or a
+# non-distributed run) writes the shared .env file, so workers never race on it.
+@pytest.fixture(scope="session", autouse=True)
 def mode():
     dotenv_file = dotenv.find_dotenv()
     dotenv.load_dotenv(dotenv_file)
     prior_mode = os.environ["MODE"]
     os.environ["MODE"] = "test"
-    dotenv.set_key(dotenv_file, "MODE", os.environ["MODE"])
+    if os.environ.get("PYTEST_XDIST_WORKER", "gw0") == "gw0":
+        dotenv.set_key(dotenv_file, "MODE", os.environ["MODE"])
     yield
     os.environ["MODE"] = prior_mode
 
 
 # ------------------------------------------------------------------------------------------------ #
-@pytest.fixture(scope="module", autouse=False)
+#                                        DATASET                                                   #
+# ------------------------------------------------------------------------------------------------ #
+# The dataset is read once per session and shared by every test, so it must be treated as
+# read-only. Tests that need to modify the data should work on a copy.
+@pytest.fixture(scope="session", autouse=False)
 def dataset():
     df = pd.read_csv(DATAFILE, index_col=None)
     df = df.astype(
@@ -87,6 +123,7 @@ def dataset():
             "Income": np.int64,
             "Children": np.int64,
             "Marital Status": "category",
+            "Own": "category",
             "Credit Rating": "category",
             "Education": "category",
         }
@@ -94,6 +131,54 @@ def dataset():
     return df
 
 
+# ------------------------------------------------------------------------------------------------ #
+@pytest.fixture(scope="session", autouse=False)
+def gender_income_split(dataset):
+    grouped = dataset.groupby("Gender", observed=True)["Income"]
+    return grouped.get_group("Male"), grouped.get_group("Female")
+
+
+# ------------------------------------------------------------------------------------------------ #
+@pytest.fixture(scope="session", autouse=False)
+def male_income(gender_income_split):
+    return gender_income_split[0].to_numpy()
+
+
+# ------------------------------------------------------------------------------------------------ #
+@pytest.fixture(scope="session", autouse=False)
+def female_income(gender_income_split):
+    return gender_income_split[1].to_numpy()
+
+
+# ------------------------------------------------------------------------------------------------ #
+@pytest.fixture(scope="session", autouse=False)
+def education_credit_ct(dataset):
+    return stats.contingency.crosstab(dataset["Education"], dataset["Credit Rating"])[1]
+
+
+# ------------------------------------------------------------------------------------------------ #
+# Seeded per test, so a test draws the same values whatever ran before it or on which worker.
+@pytest.fixture(scope="function", autouse=False)
+def rng():
+    return np.random.default_rng(SEED)
+
+
+# ------------------------------------------------------------------------------------------------ #
+@pytest.fixture(scope="session", autouse=False)
+def linear_negative_df():
+    a = np.linspace(10, 100, 100)
+    b = np.linspace(100, 10, 100)
+    return pd.DataFrame({"sample a": a, "sample b": b})
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                STATISTICAL TEST PROFILES                                         #
+# ------------------------------------------------------------------------------------------------ #
+@pytest.fixture(scope="session", autouse=False)
+def profiles():
+    return IOService.read(PROFILES)
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                              DEPENDENCY INJECTION                                                #
 # ------------------------------------------------------------------------------------------------ #
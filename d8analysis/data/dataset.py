@@ -17,7 +17,6 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 from __future__ import annotations
-import inspect
 from abc import ABC, abstractmethod, abstractproperty
 import logging
 from typing import Any, Callable, Union, List
@@ -90,8 +89,7 @@ class Dataset(ABC):
             "Number of Cells": ncells,
             "Size (Bytes)": size,
         }
-        overview = pd.DataFrame.from_dict(data=d, orient="index").reset_index()
-        overview.columns = ["Characteristic", "Total"]
+        overview = pd.DataFrame({"Characteristic": list(d.keys()), "Total": list(d.values())})
         return self._format(df=overview)
 
     # ------------------------------------------------------------------------------------------- #
@@ -104,8 +102,9 @@ class Dataset(ABC):
         info["Valid"] = self._df.count().values
         info["Null"] = self._df.isna().sum().values
         info["Validity"] = info["Valid"] / self._df.shape[0]
-        info["Cardinality"] = self._df.nunique().values
-        info["Percent Unique"] = self._df.nunique().values / self._df.shape[0]
+        cardinality = self._df.nunique().values
+        info["Cardinality"] = cardinality
+        info["Percent Unique"] = cardinality / self._df.shape[0]
         info["Size"] = self._df.memory_usage(deep=True, index=False).to_frame().reset_index()[0]
         info = round(info, 2)
         return self._format(df=info)
@@ -204,7 +203,7 @@ class Dataset(ABC):
             exclude (list[str]): List of data types to exclude from the analysis.
             groupby (str): Column used as a factor variable for descriptive statistics.
         """
-        logger.debug(f"\n\nEntering {inspect.stack()[0][3]}.")
+        logger.debug("\n\nEntering %s.", "describe")
         nums, cats = self._filter_split_data(x=x, include=include, exclude=exclude, groupby=groupby)
 
         stats = DescriptiveStats()
@@ -222,8 +221,8 @@ class Dataset(ABC):
         self, df: pd.DataFrame, groupby: Union[str, list[str]] = None
     ) -> pd.DataFrame:
         """Describes numeric columns."""
-        logger.debug(f"\n\nEntering {inspect.stack()[0][3]}.")
-        logger.debug(f"\n\n{df.head()}")
+        logger.debug("\n\nEntering %s.", "_describe_numeric")
+        logger.debug("\n\n%s", df.head())
         d = {}
         if groupby is None:
             describe = df.describe()
@@ -237,7 +236,7 @@ class Dataset(ABC):
             sk = df.groupby(by=groupby).skew()
             describe = pd.concat([describe.T, sk], axis=1)
 
-        logger.debug(f"\n\nExiting {inspect.stack()[0][3]}.")
+        logger.debug("\n\nExiting %s.", "_describe_numeric")
         return describe
 
     # ------------------------------------------------------------------------------------------- #
@@ -282,24 +281,14 @@ class Dataset(ABC):
 
         """
 
+        # Count once; the proportions are the counts over their total, as value_counts would
+        # compute with normalize=True.
         if isinstance(self._df[x], pd.Series):
-            abs = (
-                self._df[x]
-                .value_counts(normalize=False, sort=sort, bins=bins, ascending=ascending)
-                .to_frame()
-            )
-            rel = (
-                self._df[x]
-                .value_counts(normalize=True, sort=sort, bins=bins, ascending=ascending)
-                .to_frame()
-            )
+            counts = self._df[x].value_counts(sort=sort, bins=bins, ascending=ascending)
         else:
-            abs = (
-                self._df[x].value_counts(normalize=False, sort=sort, ascending=ascending).to_frame()
-            )
-            rel = (
-                self._df[x].value_counts(normalize=True, sort=sort, ascending=ascending).to_frame()
-            )
+            counts = self._df[x].value_counts(sort=sort, ascending=ascending)
+        abs = counts.to_frame()
+        rel = (counts / counts.sum()).rename("proportion").to_frame()
         freq = abs.join(rel, on=x)
         freq.loc["Total"] = freq.sum()
         freq["cumulative"] = freq["proportion"].cumsum()
@@ -352,7 +341,7 @@ class Dataset(ABC):
         exclude: list[str] = None,
     ) -> pd.DataFrame:
         """Filters and splits the dataframe into numeric and categorical data dataframes according to the provided arguments"""
-        logger.debug(f"\n\nEntering {inspect.stack()[0][3]}.")
+        logger.debug("\n\nEntering %s.", "_filter_split_data")
         # Filter by include / exclude data type arguments
         df = self._df
         if include is not None:
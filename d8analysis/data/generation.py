@@ -117,7 +117,7 @@ def beta(data: np.ndarray, size: int = None) -> np.ndarray:
     a, b, loc, scale = get_params(data=data, distribution="beta")
 
     name = "Beta Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
+    x_range = np.linspace(np.min(data), np.max(data), NUM_POINTS)
     params = (
         r"$\alpha=$"
         + str(round(a, 2))
@@ -186,7 +186,7 @@ def norm(data: np.ndarray, size: int = None) -> np.ndarray:
     loc, scale = get_params(data=data, distribution="norm")
 
     name = "Normal Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
+    x_range = np.linspace(np.min(data), np.max(data), NUM_POINTS)
     params = "loc = " + str(round(loc, 2)) + ", scale = " + str(round(scale, 2))
     formula = r"$ f(x) = \frac{\exp(-x^2/2)}{\sqrt{2\pi}}$" + "\n" + r"For real number x"
 
@@ -237,7 +237,7 @@ def chi2(data: np.ndarray, size: int = None) -> np.ndarray:
     _, loc, scale = get_params(data=data, distribution="X2")
     df = len(data) - 1
     name = r"$\chi^2$ Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
+    x_range = np.linspace(np.min(data), np.max(data), NUM_POINTS)
     params = "loc = " + str(round(loc, 2)) + ", scale = " + str(round(scale, 2))
     formula = (
         r"$ f(x, k) = \frac{1}{2^{k/2} \Gamma \left( k/2 \right)} x^{k/2-1} \exp \left( -x/2 \right)$"
@@ -297,7 +297,7 @@ def exponential(data: np.ndarray, size: int = None) -> np.ndarray:
     loc, scale = get_params(data=data, distribution="exponential")
     rvs = stats.expon.rvs(loc=loc, scale=scale, size=size)
     name = "Exponential Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
+    x_range = np.linspace(np.min(data), np.max(data), NUM_POINTS)
     params = "\nloc = " + str(round(loc, 2)) + ", scale = " + str(round(scale, 2))
     formula = r"$f(x) = \exp(-x)$" + "\n" + r"for x >= 0"
 
@@ -347,7 +347,7 @@ def f(data: np.ndarray, size: int = None) -> np.ndarray:
     """
     dfn, dfd, loc, scale = get_params(data=data, distribution="f")
     name = "F Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
+    x_range = np.linspace(np.min(data), np.max(data), NUM_POINTS)
     params = (
         r"$df_1=$"
         + str(round(dfn, 2))
@@ -416,7 +416,7 @@ def gamma(data: np.ndarray, size: int = None) -> np.ndarray:
     """
     a, loc, scale = get_params(data=data, distribution="gamma")
     name = "Gamma Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
+    x_range = np.linspace(np.min(data), np.max(data), NUM_POINTS)
     params = (
         "a ="
         + str(round(a, 2))
@@ -477,7 +477,7 @@ def logistic(data: np.ndarray, size: int = None) -> np.ndarray:
     """
     loc, scale = get_params(data=data, distribution="logistic")
     name = "Logistic Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
+    x_range = np.linspace(np.min(data), np.max(data), NUM_POINTS)
     params = "loc = " + str(round(loc, 2)) + ", scale = " + str(round(scale, 2))
     formula = r"$ f(x) = \frac{\exp(-x)}{(1+\exp(-x))^2}$"
 
@@ -527,7 +527,7 @@ def lognorm(data: np.ndarray, size: int = None) -> np.ndarray:
     """
     s, loc, scale = get_params(data=data, distribution="lognorm")
     name = "Lognorm Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
+    x_range = np.linspace(np.min(data), np.max(data), NUM_POINTS)
     params = (
         "s ="
         + str(round(s, 2))
@@ -588,7 +588,7 @@ def uniform(data: np.ndarray, size: int = None) -> np.ndarray:
     """
     loc, scale = get_params(data=data, distribution="uniform")
     name = "Uniform Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
+    x_range = np.linspace(np.min(data), np.max(data), NUM_POINTS)
     params = "loc = " + str(round(loc, 2)) + ", scale = " + str(round(scale, 2))
     formula = r"$ f(x) = \frac{1}{(b-a)}$" + "for a <= x <= b"
 
@@ -639,7 +639,7 @@ def weibull(data: np.ndarray, size: int = None) -> np.ndarray:
     c, loc, scale = get_params(data=data, distribution="weibull")
 
     name = "Weibull Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
+    x_range = np.linspace(np.min(data), np.max(data), NUM_POINTS)
     params = (
         "c ="
         + str(round(c, 2))
@@ -18,8 +18,12 @@
 # ================================================================================================ #
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from functools import lru_cache
+import hashlib
 import logging
+import os
 from dataclasses import dataclass, fields
+from typing import Dict, Optional
 import seaborn as sns
 
 from d8analysis.data.dataclass import DataClass
@@ -35,6 +39,8 @@ ANALYSIS_TYPES = {
     "multivariate": "Multivariate",
 }
 STAT_CONFIG = "config/stats.yml"
+# ------------------------------------------------------------------------------------------------ #
+_CREATED_PROFILES: Dict[tuple, StatTestProfile] = {}  # Profiles keyed by (class, id)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -58,14 +64,55 @@ class StatTestProfile(DataClass):
     use_when: str = None
 
     @classmethod
-    def create(cls, id) -> None:
-        """Loads the values from the statistical tests file"""
-        profiles = IOService.read(STAT_CONFIG)
-        profile = profiles[id]
-        fieldlist = {f.name for f in fields(cls) if f.init}
-        filtered_dict = {k: v for k, v in profile.items() if k in fieldlist}
-        filtered_dict["id"] = id
-        return cls(**filtered_dict)
+    def create(cls, id) -> StatTestProfile:
+        """Loads the values from the statistical tests file
+
+        Profiles are read-only configuration, so each is built once per class and id, and the
+        same instance is returned on subsequent calls.
+        """
+        key = (cls, id)
+        created = _CREATED_PROFILES.get(key)
+        if created is None:
+            profile = cls._read_profiles()[id]
+            fieldlist = {f.name for f in fields(cls) if f.init}
+            filtered_dict = {k: v for k, v in profile.items() if k in fieldlist}
+            filtered_dict["id"] = id
+            created = cls(**filtered_dict)
+            _CREATED_PROFILES[key] = created
+        return created
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _read_profiles() -> dict:
+        """Returns the parsed statistical tests file, reading it from disk on first use only."""
+        profiles = StatTestProfile._read_compiled_profiles()
+        if profiles is None:
+            profiles = IOService.read(STAT_CONFIG)
+        return profiles
+
+    @staticmethod
+    def _read_compiled_profiles() -> Optional[dict]:
+        """Returns the profiles compiled into _stats_data.py, or None if the module is stale.
+
+        The module is written by d8analysis/setup.py along with the digest of the statistical
+        tests file it was generated from, and is only trusted while that file is unchanged.
+        """
+        try:
+            from d8analysis.quantitative.inferential import _stats_data
+        except ImportError:  # pragma: no cover
+            return None
+        if not os.path.exists(STAT_CONFIG):  # pragma: no cover
+            return _stats_data.STATS
+        with open(STAT_CONFIG, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        if digest != _stats_data.SOURCE_DIGEST:
+            logger.warning(
+                "%s is out of date with %s and will not be used. Run d8analysis/setup.py to regenerate it.",
+                _stats_data.__file__,
+                STAT_CONFIG,
+            )
+            return None
+        return _stats_data.STATS
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -35,6 +35,9 @@ from d8analysis.quantitative.inferential.base import (
 )
 from d8analysis.data.generation import RVSDistribution
 
+# ------------------------------------------------------------------------------------------------ #
+EXACT_MAX_N = 10000  # SciPy uses the exact pvalue for two samples no larger than this
+
 
 # ------------------------------------------------------------------------------------------------ #
 #                                     TEST RESULT                                                  #
@@ -320,6 +323,18 @@ class KSTest(StatisticalTest):
     __id = "kstest"
 
     def __init__(
+        self,
+        a: np.ndarray = None,
+        b: Union[str, np.ndarray] = None,
+        a_name: str = "Sample 1",
+        b_name: str = "Sample 2",
+        alpha: float = 0.05,
+    ) -> None:
+        super().__init__()
+        self._profile = StatTestProfileOne.create(self.__id)
+        self.configure(a=a, b=b, a_name=a_name, b_name=b_name, alpha=alpha)
+
+    def configure(
         self,
         a: np.ndarray,
         b: Union[str, np.ndarray],
@@ -327,13 +342,16 @@ class KSTest(StatisticalTest):
         b_name: str = "Sample 2",
         alpha: float = 0.05,
     ) -> None:
-        super().__init__()
+        """Sets the data for the next run, allowing one instance to be reused across runs.
+
+        The profile loaded at construction is retained; any prior result is discarded. Arguments
+        are as documented for the class.
+        """
         self._a = a
         self._b = b
         self._a_name = a_name
         self._b_name = b_name
         self._alpha = alpha
-        self._profile = StatTestProfileOne.create(self.__id)
         self._result = None
 
     @property
@@ -349,19 +367,30 @@ class KSTest(StatisticalTest):
     def run(self) -> None:
         """Performs the statistical test and creates a result object."""
 
-        n = len(self._a)
+        if self._a is None or self._b is None:
+            msg = "Samples a and b are not set. Call configure() before run()."
+            self._logger.error(msg)
+            raise ValueError(msg)
 
-        # Conduct the two-sided ks test
-        try:
-            result = stats.kstest(rvs=self._a, cdf=self._b, alternative="two-sided")
-        except (
-            AttributeError
-        ) as e:  # pragma: no cover - actually pytest-coverage not picking this up.
-            msg = f"Distribution {self._reference_distribution} is not supported.\n{e}"
-            self._logger.exception(msg)
-            raise
+        n = len(self._a)
 
-        inference = self._infer(pvalue=result.pvalue)
+        # Conduct the two-sided ks test. A sample compared against itself has identical ECDFs.
+        if self._a is self._b:
+            statistic, pvalue = 0.0, 1.0
+        elif self._use_integer_path(a=self._a, b=self._b):
+            statistic, pvalue = self._kstest_integer(a=self._a, b=self._b)
+        else:
+            try:
+                result = stats.kstest(rvs=self._a, cdf=self._b, alternative="two-sided")
+            except (
+                AttributeError
+            ) as e:  # pragma: no cover - actually pytest-coverage not picking this up.
+                msg = f"Distribution {self._reference_distribution} is not supported.\n{e}"
+                self._logger.exception(msg)
+                raise
+            statistic, pvalue = result.statistic, result.pvalue
+
+        inference = self._infer(pvalue=pvalue)
 
         interpretation = None
         if len(self._a) < 50:
@@ -375,9 +404,9 @@ class KSTest(StatisticalTest):
             H0=self._profile.H0,
             statistic=self._profile.statistic,
             hypothesis=self._profile.hypothesis,
-            value=result.statistic,
-            pvalue=result.pvalue,
-            result=self._report_results(n=n, statistic=result.statistic, pvalue=result.pvalue),
+            value=statistic,
+            pvalue=pvalue,
+            result=self._report_results(n=n, statistic=statistic, pvalue=pvalue),
             a=self._a,
             b=self._b,
             a_name=self._a_name,
@@ -387,6 +416,47 @@ class KSTest(StatisticalTest):
             alpha=self._alpha,
         )
 
+    def _use_integer_path(self, a: np.ndarray, b: Union[str, np.ndarray]) -> bool:
+        """Returns True if both samples can be counted and SciPy would use the asymptotic pvalue.
+
+        Up to EXACT_MAX_N SciPy computes the exact pvalue, so those samples are left to it in
+        order that the pvalue does not depend upon the dtype of the data. The sizes are checked
+        before the values, which require a scan of each sample.
+        """
+        return (
+            not isinstance(b, str)
+            and max(len(a), len(b)) > EXACT_MAX_N
+            and self._is_bounded_integer(a)
+            and self._is_bounded_integer(b)
+        )
+
+    def _is_bounded_integer(self, x: Union[str, np.ndarray]) -> bool:
+        """Returns True if x is a non-negative integer sample whose values are small enough to count."""
+        if isinstance(x, str):
+            return False
+        x = np.asarray(x)
+        return (
+            x.dtype.kind in "iu" and x.size > 0 and x.min() >= 0 and int(x.max()) < 10 * x.size
+        )
+
+    def _kstest_integer(self, a: np.ndarray, b: np.ndarray) -> tuple:
+        """Two sample test for non-negative integer data that evaluates the ECDFs from bin counts.
+
+        Counting the occurrences of each value replaces the sort of the pooled samples, and a
+        single cumulative sum of the difference in relative frequencies gives the difference
+        between the ECDFs at every point in the support. The pvalue is computed from the
+        asymptotic distribution of the statistic, as SciPy does for samples of this size.
+        """
+        a = np.asarray(a)
+        b = np.asarray(b)
+        length = int(max(a.max(), b.max())) + 1
+        # The ECDF difference is the running sum of the difference in relative frequencies.
+        delta = np.bincount(a, minlength=length) / a.size - np.bincount(b, minlength=length) / b.size
+        statistic = np.max(np.abs(np.cumsum(delta)))
+        en = a.size * b.size / (a.size + b.size)
+        pvalue = np.clip(stats.kstwo.sf(statistic, np.round(en)), 0, 1)
+        return statistic, pvalue
+
     def _infer(self, pvalue: float) -> str:  # pragma: no cover
         """Formats the inference for the hypothesis based upon whether it is one or two sample"""
         if isinstance(self._b, str):
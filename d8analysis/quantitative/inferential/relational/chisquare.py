@@ -43,6 +43,7 @@ class ChiSquareIndependenceResult(StatTestResult):
     data: pd.DataFrame = None
     a: str = None
     b: str = None
+    contingency_table: np.ndarray = None
 
     @inject
     def __post_init__(self, canvas: Canvas = Provide[D8AnalysisContainer.canvas.seaborn]) -> None:
@@ -156,9 +157,16 @@ class ChiSquareIndependenceResult(StatTestResult):
         elif self._ax2 is None:
             _, self._ax2 = self._canvas.get_figaxes()
 
-        self._ax2 = sns.countplot(
-            data=self.data, x=self.a, hue=self.b, ax=self._ax2, palette=self._canvas.palette
-        )
+        if self.data is None:
+            self._ax2 = sns.heatmap(
+                self.contingency_table, annot=True, fmt="g", cmap="Blues", ax=self._ax2
+            )
+            self._ax2.set_ylabel(self.a)
+            self._ax2.set_xlabel(self.b)
+        else:
+            self._ax2 = sns.countplot(
+                data=self.data, x=self.a, hue=self.b, ax=self._ax2, palette=self._canvas.palette
+            )
 
         title = f"Contingency Table\n{self.a.capitalize()} and {self.b.capitalize()}"
         self._ax2.set_title(title)
@@ -172,19 +180,50 @@ class ChiSquareIndependenceTest(StatisticalTest):
     """Chi-Square Test of Independence
 
     The Chi-Square test of independence is used to determine if there is a significant relationship between two nominal (categorical) variables.  The frequency of each category for one nominal variable is compared across the categories of the second nominal variable.
+
+    Args:
+        data (pd.DataFrame): DataFrame containing the variables. Optional if a contingency table
+            is provided.
+        a (str): Name of the first nominal variable.
+        b (str): Name of the second nominal variable.
+        alpha (float): Level of significance. Default is 0.05.
+        contingency_table (np.ndarray): Observed frequencies of a (rows) by b (columns). Optional.
+            If provided, it is used in place of the data, which must then be omitted, and the
+            sample size is taken from its total. The names a and b then serve only as labels.
     """
 
     __id = "x2ind"
 
     def __init__(
-        self, data: pd.DataFrame, a: str = None, b: str = None, alpha: float = 0.05
+        self,
+        data: pd.DataFrame = None,
+        a: str = None,
+        b: str = None,
+        alpha: float = 0.05,
+        contingency_table: np.ndarray = None,
     ) -> None:
         super().__init__()
+        self._profile = StatTestProfileTwo.create(self.__id)
+        self.configure(data=data, a=a, b=b, alpha=alpha, contingency_table=contingency_table)
+
+    def configure(
+        self,
+        data: pd.DataFrame = None,
+        a: str = None,
+        b: str = None,
+        alpha: float = 0.05,
+        contingency_table: np.ndarray = None,
+    ) -> None:
+        """Sets the data for the next run, allowing one instance to be reused across runs.
+
+        The profile loaded at construction is retained; any prior result is discarded. Arguments
+        are as documented for the class.
+        """
         self._data = data
         self._a = a
         self._b = b
         self._alpha = alpha
-        self._profile = StatTestProfileTwo.create(self.__id)
+        self._contingency_table = contingency_table
         self._result = None
 
     @property
@@ -200,18 +239,33 @@ class ChiSquareIndependenceTest(StatisticalTest):
     def run(self) -> None:
         """Performs the statistical test and creates a result object."""
 
-        n = len(self._data)
+        obs = self._contingency_table
+        if obs is None and self._data is None:
+            msg = "No data or contingency table to test. Call configure() before run()."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        if obs is not None and self._data is not None:
+            msg = "Provide either data or a contingency table, not both."
+            self._logger.error(msg)
+            raise ValueError(msg)
+
+        if obs is None:
+            n = len(self._data)
+            obs = stats.contingency.crosstab(self._data[self._a], self._data[self._b])[1]
+        else:
+            n = int(np.sum(obs))
 
-        obs = stats.contingency.crosstab(self._data[self._a], self._data[self._b])
+        statistic, pvalue, dof, exp = stats.chi2_contingency(obs)
 
-        statistic, pvalue, dof, exp = stats.chi2_contingency(obs[1])
+        a = self._a or "rows"
+        b = self._b or "columns"
 
-        result = self._report_results(statistic=statistic, pvalue=pvalue, dof=dof, n=n)
+        result = self._report_results(a=a, b=b, statistic=statistic, pvalue=pvalue, dof=dof, n=n)
 
         if pvalue > self._alpha:  # pragma: no cover
-            inference = f"The pvalue {round(pvalue,2)} is greater than level of significance {int(self._alpha*100)}%; therefore, the null hypothesis is not rejected. The evidence against independence of {self._a} and {self._b} is not significant."
+            inference = f"The pvalue {round(pvalue,2)} is greater than level of significance {int(self._alpha*100)}%; therefore, the null hypothesis is not rejected. The evidence against independence of {a} and {b} is not significant."
         else:
-            inference = f"The pvalue {round(pvalue,2)} is less than level of significance {int(self._alpha*100)}%; therefore, the null hypothesis is rejected. The evidence against independence of {self._a} and {self._b} is significant."
+            inference = f"The pvalue {round(pvalue,2)} is less than level of significance {int(self._alpha*100)}%; therefore, the null hypothesis is rejected. The evidence against independence of {a} and {b} is significant."
 
         # Create the result object.
         self._result = ChiSquareIndependenceResult(
@@ -224,11 +278,14 @@ class ChiSquareIndependenceTest(StatisticalTest):
             pvalue=pvalue,
             result=result,
             data=self._data,
-            a=self._a,
-            b=self._b,
+            a=a,
+            b=b,
+            contingency_table=obs,
             inference=inference,
             alpha=self._alpha,
         )
 
-    def _report_results(self, statistic: float, pvalue: float, dof: float, n: int) -> str:
-        return f"X\u00b2 Test of Independence\n{self._a.capitalize()} and {self._b.capitalize()}\nX\u00b2({dof}, N={n})={round(statistic,2)}, {self._report_pvalue(pvalue)}."
+    def _report_results(
+        self, a: str, b: str, statistic: float, pvalue: float, dof: float, n: int
+    ) -> str:
+        return f"X\u00b2 Test of Independence\n{a.capitalize()} and {b.capitalize()}\nX\u00b2({dof}, N={n})={round(statistic,2)}, {self._report_pvalue(pvalue)}."
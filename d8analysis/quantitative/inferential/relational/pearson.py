@@ -136,6 +136,8 @@ class PearsonCorrelationTest(StatisticalTest):
     def run(self) -> None:
         """Performs the statistical test and creates a result object."""
 
+        self._validate()
+
         try:
             pearson_result = stats.pearsonr(
                 x=self._data[self._a].values, y=self._data[self._b].values, alternative="two-sided"
@@ -176,6 +178,18 @@ class PearsonCorrelationTest(StatisticalTest):
             alpha=self._alpha,
         )
 
+    def _validate(self) -> None:
+        """Checks that the data is provided and contains both variables."""
+        if self._data is None:
+            msg = "No data to test. A DataFrame containing variables a and b is required."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        for x in (self._a, self._b):
+            if x not in self._data.columns:
+                msg = f"{x} is not a valid variable in the dataset."
+                self._logger.error(msg)
+                raise KeyError(msg)
+
     def _report_results(self, r: float, pvalue: float, dof: float) -> str:
         return f"Pearson Correlation Test\nr({dof})={round(r,2)}, {self._report_pvalue(pvalue)}\n{self._interpret_r(r=r).capitalize()}"
 
@@ -74,27 +74,27 @@ class SpearmanCorrelationResult(StatTestResult):
         x = np.linspace(dist.ppf(0.001), dist.ppf(0.999), 500)
         y = dist.pdf(x)
         self._ax1 = sns.lineplot(x=x, y=y, markers=False, dashes=False, sort=True, ax=self._ax1)
-        self._logger.debug(f"Len x: {len(x)}")
-        self._logger.debug(f"Min x: {min(x)}")
-        self._logger.debug(f"Max x: {max(x)}")
+        self._logger.debug("Len x: %s", len(x))
+        self._logger.debug("Min x: %s", x.min())
+        self._logger.debug("Max x: %s", x.max())
 
-        self._logger.debug(f"Len y: {len(y)}")
-        self._logger.debug(f"Min y: {min(y)}")
-        self._logger.debug(f"Max y: {max(y)}")
+        self._logger.debug("Len y: %s", len(y))
+        self._logger.debug("Min y: %s", y.min())
+        self._logger.debug("Max y: %s", y.max())
 
         # Transform the r statistic and pvalue as per https://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.spearmanr.html#scipy.stats.spearmanr
         critical_value = np.abs(
             self.value * np.sqrt(self.dof / ((self.value + 1.0) * (1.0 - self.value)))
         )
-        self._logger.debug(f"Computing critical value: {critical_value}")
+        self._logger.debug("Computing critical value: %s", critical_value)
         pvalue = dist.cdf(-critical_value) + dist.sf(critical_value)
-        self._logger.debug(f"Computing p value: {pvalue}")
+        self._logger.debug("Computing p value: %s", pvalue)
 
         # Compute reject region.
         upper = x >= critical_value
         lower = x <= -critical_value
-        self._logger.debug(f"Num values greater than critical values {sum(upper)}")
-        self._logger.debug(f"Num values less than critical values {sum(lower)}")
+        self._logger.debug("Num values greater than critical values %s", upper.sum())
+        self._logger.debug("Num values less than critical values %s", lower.sum())
 
         # Plot statistic
         self._logger.debug("Plotting statistic")
@@ -105,11 +105,11 @@ class SpearmanCorrelationResult(StatTestResult):
         statistic = round(self.value, 4)
 
         idx = np.where(xdata > self.value)[0][0]
-        self._logger.debug(f"Statistic index: {idx}")
+        self._logger.debug("Statistic index: %s", idx)
         a = xdata[idx]
         b = ydata[idx]
-        self._logger.debug(f"a: {a}")
-        self._logger.debug(f"b: {b}")
+        self._logger.debug("a: %s", a)
+        self._logger.debug("b: %s", b)
         _ = sns.regplot(
             x=[a],
             y=[b],
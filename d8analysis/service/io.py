@@ -49,6 +49,13 @@ from typing import Any, Union, List
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
 # ------------------------------------------------------------------------------------------------ #
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader
+
+    logger.warning("LibYAML is not available. Falling back to the pure Python YAML loader.")
+# ------------------------------------------------------------------------------------------------ #
 
 
 class IO(ABC):  # pragma: no cover
@@ -172,7 +179,7 @@ class YamlIO(IO):  # pragma: no cover
     def _read(cls, filepath: str, **kwargs) -> dict:
         with open(filepath, "r") as f:
             try:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=SafeLoader)
             except yaml.YAMLError as e:  # pragma: no cover
                 logger.error(e)
                 raise IOError(e)
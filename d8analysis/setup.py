@@ -16,7 +16,9 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
+import hashlib  # pragma: no cover
 import logging  # pragma: no cover
+from pprint import pformat  # pragma: no cover
 
 import pandas as pd  # pragma: no cover
 
@@ -25,6 +27,7 @@ from d8analysis.service.io import IOService  # pragma: no cover
 # ------------------------------------------------------------------------------------------------ #
 SOURCE = "notes/Statistical Tests.xlsx"  # pragma: no cover
 DEST = "config/stats.yml"  # pragma: no cover
+DEST_MODULE = "d8analysis/quantitative/inferential/_stats_data.py"  # pragma: no cover
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)  # pragma: no cover
 
@@ -38,14 +41,31 @@ def save_as_yaml(df: pd.DataFrame, destination: str) -> None:  # pragma: no cove
     IOService.write(filepath=destination, data=d)
 
 
+def save_as_module(d: dict, source: str, destination: str) -> None:  # pragma: no cover
+    """Writes the profiles as a Python literal so they can be imported without YAML parsing.
+
+    pformat sorts the keys of each dictionary on every supported Python version. The digest of
+    the source file is recorded so that a stale module is detected on load.
+    """
+    with open(source, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    with open(destination, "w") as f:
+        f.write(f"# Generated by d8analysis/setup.py from {source}. Do not edit.\n")
+        f.write("from math import nan  # noqa: F401\n\n")
+        f.write(f'SOURCE_DIGEST = "{digest}"\n')
+        f.write(f"STATS = {pformat(d, width=100)}\n")
+
+
 def report(df: pd.DataFrame) -> None:  # pragma: no cover
     report = df[["name", "analysis", "hypothesis", "H0"]]
-    logger.info(f"Statistical Tests Loaded\n{report}")
+    logger.info("Statistical Tests Loaded\n%s", report)
 
 
 def main():  # pragma: no cover
     df = get_stat_tests(source=SOURCE)
     save_as_yaml(df=df, destination=DEST)
+    d = IOService.read(filepath=DEST)
+    save_as_module(d=d, source=DEST, destination=DEST_MODULE)
     report(df=df)
 
 
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Exploratory Data Analysis Framework                                                 #
+# Version    : 0.2.20                                                                              #
+# Python     : 3.10.12                                                                             #
+# Filename   : /tests/_banner.py                                                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/d8analysis                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 09:12:40 am                                                #
+# Modified   : Friday October 16th 2026 09:12:40 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import logging
+from time import strftime
+
+# ------------------------------------------------------------------------------------------------ #
+# Separator lines frame the debug output logged between banners, so they are only added at DEBUG.
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+TIMESTAMP_FORMAT = "%I:%M:%S %p on %m/%d/%Y"  # Time and date in a single strftime call
+START_TEMPLATE = "\n\nStarted %s at %s%s"  # The last field takes the separator, if any
+END_TEMPLATE = "\nCompleted %s in %s seconds at %s%s"
+
+
+# ------------------------------------------------------------------------------------------------ #
+def log_start(logger: logging.Logger, name: str) -> None:
+    """Logs the banner announcing the start of a test, if the logger is enabled for INFO."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    separator = double_line if logger.isEnabledFor(logging.DEBUG) else ""
+    logger.info(START_TEMPLATE, name, strftime(TIMESTAMP_FORMAT), separator)
+
+
+# ------------------------------------------------------------------------------------------------ #
+def log_end(logger: logging.Logger, name: str, duration: float) -> None:
+    """Logs the banner announcing the completion of a test, if the logger is enabled for INFO."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    separator = single_line if logger.isEnabledFor(logging.DEBUG) else ""
+    logger.info(END_TEMPLATE, name, duration, strftime(TIMESTAMP_FORMAT), separator)
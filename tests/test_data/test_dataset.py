@@ -16,8 +16,6 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
-import inspect
-from datetime import datetime
 import pytest
 import logging
 
@@ -28,119 +26,33 @@ from d8analysis.data.credit import CreditScoreDataset, Consumer
 
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
+
+
 # ------------------------------------------------------------------------------------------------ #
-double_line = f"\n{100 * '='}"
-single_line = f"\n{100 * '-'}"
+@pytest.fixture(scope="class")
+def ds(dataset):
+    return CreditScoreDataset(df=dataset)
 
 
 @pytest.mark.dataset
 class TestDataset:  # pragma: no cover
     # ============================================================================================ #
-    def test_length(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_length(self, ds):
         assert (len(ds)) == 164
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
 
     # ============================================================================================ #
-    def test_size(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
-        assert isinstance(ds.size, np.int64)
-        logger.debug(ds.size)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
+    def test_size(self, ds):
+        size = ds.size
+        assert isinstance(size, np.int64)
+        logger.debug(size)
 
     # ============================================================================================ #
-    def test_get_columns(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_get_columns(self, ds):
         columns = ds.columns
         assert len(columns) == 8
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
 
     # ============================================================================================ #
-    def test_get_item(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_get_item(self, ds):
         item = ds[10]
         assert isinstance(item, Consumer)
         assert isinstance(item.Gender, str)
@@ -152,713 +64,148 @@ class TestDataset:  # pragma: no cover
         assert isinstance(item.__str__(), str)
         assert isinstance(item.as_dict(), dict)
         assert isinstance(item.as_df(), pd.DataFrame)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
 
     # ============================================================================================ #
-    def test_summary(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
-        assert isinstance(ds.summary, pd.DataFrame)
-        logger.debug(ds.summary)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
+    def test_summary(self, ds):
+        summary = ds.summary
+        assert isinstance(summary, pd.DataFrame)
+        logger.debug(summary)
 
     # ============================================================================================ #
-    def test_info(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
-        assert isinstance(ds.info, pd.DataFrame)
-        logger.debug(ds.info)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
+    def test_info(self, ds):
+        info = ds.info
+        assert isinstance(info, pd.DataFrame)
+        logger.debug(info)
 
     # ============================================================================================ #
-    def test_overview(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
-        assert isinstance(ds.overview, pd.DataFrame)
-        logger.debug(ds.overview)
-
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
+    def test_overview(self, ds):
+        overview = ds.overview
+        assert isinstance(overview, pd.DataFrame)
+        logger.debug(overview)
 
     # ============================================================================================ #
-    def test_sample(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_sample(self, ds):
         assert len(ds.sample()) == 5
 
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
     # ============================================================================================ #
-    def test_dtypes(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_dtypes(self, ds):
         dt = ds.dtypes
         assert isinstance(dt, pd.DataFrame)
         logger.debug(dt)
 
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
     # ============================================================================================ #
-    def test_select(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
-        df = ds.select(include=["Gender", "Education"])
-        assert df.shape[1] == 2
-        df = ds.select(exclude=["Gender"])
+    @pytest.mark.parametrize(
+        "kwargs, ncols",
+        [({"include": ["Gender", "Education"]}, 2), ({"exclude": ["Gender"]}, 7), ({}, 8)],
+        ids=["include", "exclude", "all"],
+    )
+    def test_select(self, ds, kwargs, ncols):
+        df = ds.select(**kwargs)
+        assert df.shape[1] == ncols
         logger.debug(df.head())
-        assert df.shape[1] == dataset.shape[1] - 1
-        df = ds.select()
-        assert df.shape[1] == 8
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
 
     # ============================================================================================ #
-    def test_subset(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_subset(self, ds, dataset):
         condition = lambda df: df["Gender"] == "Male"  # noqa
         df = ds.subset(condition=condition)
         assert df.shape[0] < dataset.shape[0]
         condition = lambda df: df["xyz"] == "Male"  # noqa
-        with pytest.raises(Exception):
+        with pytest.raises(KeyError, match="xyz"):
             ds.subset(condition=condition)
 
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
     # ============================================================================================ #
-    def test_head(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_head(self, ds):
         df = ds.head()
         assert len(df) == 5
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
 
     # ============================================================================================ #
-    def test_describe_num(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_describe_num(self, ds):
         desc = ds.describe(x="Income")
         assert isinstance(desc.numeric, pd.DataFrame)
         logger.debug(desc.numeric)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
 
     # ============================================================================================ #
-    def test_describe_cat(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_describe_cat(self, ds):
         desc = ds.describe(x="Education")
         assert isinstance(desc.categorical, pd.DataFrame)
         logger.debug(desc.categorical)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
 
     # ============================================================================================ #
-    def test_describe_cat_with_cat_group(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_describe_cat_with_cat_group(self, ds):
         desc = ds.describe(x="Education", groupby="Credit Rating")
         assert isinstance(desc.categorical, pd.DataFrame)
         logger.debug(desc.categorical)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
 
     # ============================================================================================ #
-    def test_describe_both(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_describe_both(self, ds):
         desc = ds.describe(x=["Income", "Education"])
         assert isinstance(desc.numeric, pd.DataFrame)
         logger.debug(desc.numeric)
         assert isinstance(desc.categorical, pd.DataFrame)
         logger.debug(desc.categorical)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
 
     # ============================================================================================ #
-    def test_describe_include(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_describe_include(self, ds):
         desc = ds.describe(include=["category", "object"])
         assert isinstance(desc.categorical, pd.DataFrame)
         logger.debug(desc.categorical)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
 
     # ============================================================================================ #
-    def test_describe_exclude(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_describe_exclude(self, ds):
         desc = ds.describe(exclude=["object", "float"])
         assert isinstance(desc.numeric, pd.DataFrame)
         logger.debug(desc.numeric)
         assert isinstance(desc.categorical, pd.DataFrame)
         logger.debug(desc.categorical)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
 
     # ============================================================================================ #
-    def test_describe_groupby(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_describe_groupby(self, ds):
         desc = ds.describe(x="Income", groupby="Education")
         assert isinstance(desc.numeric, pd.DataFrame)
         logger.debug(desc.numeric)
 
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
     # ============================================================================================ #
-    def test_describe_groupby_all(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_describe_groupby_all(self, ds):
         desc = ds.describe(groupby="Education")
         assert isinstance(desc.numeric, pd.DataFrame)
         logger.debug(desc.numeric)
 
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
     # ============================================================================================ #
-    def test_unique(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_unique(self, ds):
         df = ds.unique(columns=["Gender", "Education"])
         assert isinstance(df, pd.DataFrame)
         assert df.shape[0] == 10
         df = ds.unique()
         assert isinstance(df, pd.DataFrame)
         assert df.shape[0] > 10
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
 
     # ============================================================================================ #
-    def test_as_df(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_as_df(self, ds):
         df = ds.as_df()
         assert isinstance(df, pd.DataFrame)
         assert df.shape[0] == 164
         assert df.shape[1] == 8
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
 
     # ============================================================================================ #
-    def test_frequency(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_frequency(self, ds):
         df = ds.frequency(x=["Education", "Credit Rating"])
         assert isinstance(df, pd.DataFrame)
         assert "Cumulative" in df.columns
-        logger.debug(f"\n{df}")
-
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
+        logger.debug("\n%s", df)
 
     # ============================================================================================ #
-    def test_histable(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_histable(self, ds):
         df = ds.frequency(x="Income", bins=4)
         assert isinstance(df, pd.DataFrame)
         assert "Cumulative" in df.columns
-        logger.debug(f"\n{df}")
-
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
+        logger.debug("\n%s", df)
 
     # ============================================================================================ #
-    def test_top_n(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        ds = CreditScoreDataset(df=dataset)
+    def test_top_n(self, ds):
         df = ds.top_n(x="Income", n=10)
         assert isinstance(df, pd.DataFrame)
         assert df.shape[0] == 10
-        logger.debug(f"\n{df}")
+        logger.debug("\n%s", df)
 
-        with pytest.raises(KeyError):
+        with pytest.raises(KeyError, match="fake is not a valid variable"):
             ds.top_n(x="fake", n=5)
-
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
@@ -16,8 +16,6 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
-import inspect
-from datetime import datetime
 import pytest
 import logging
 
@@ -29,25 +27,12 @@ from d8analysis.data.generation import RVSDistribution, DISTRIBUTIONS, Distribut
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
 # ------------------------------------------------------------------------------------------------ #
-double_line = f"\n{100 * '='}"
-single_line = f"\n{100 * '-'}"
 
 
 @pytest.mark.rvs
 class TestRVSDistribution:  # pragma: no cover
     # ============================================================================================ #
-    def test_rvs(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
+    def test_rvs(self, dataset):
         data = dataset["Income"].values
         dg = RVSDistribution()
         for dist in DISTRIBUTIONS.keys():
@@ -57,22 +42,7 @@ class TestRVSDistribution:  # pragma: no cover
             assert isinstance(dg.pdf, Distribution)
             assert isinstance(dg.cdf, Distribution)
             assert len(dg.data) == len(data)
-            logger.debug(f"\n{dg.rvs}")
-            logger.debug(f"\n{dg.pdf}")
-            logger.debug(f"\n{dg.cdf}")
-            logger.debug(repr(dg.rvs))
-
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
+            logger.debug("\n%s", dg.rvs)
+            logger.debug("\n%s", dg.pdf)
+            logger.debug("\n%s", dg.cdf)
+            logger.debug("%r", dg.rvs)
@@ -16,8 +16,6 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
-import inspect
-from datetime import datetime
 import pytest
 import logging
 
@@ -27,25 +25,12 @@ from d8analysis.quantitative.descriptive import categorical, continuous
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
 # ------------------------------------------------------------------------------------------------ #
-double_line = f"\n{100 * '='}"
-single_line = f"\n{100 * '-'}"
 
 
 @pytest.mark.stats
 class TestStats:  # pragma: no cover
     # ============================================================================================ #
-    def test_continuous(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
+    def test_continuous(self, dataset):
         stats = continuous.ContinuousStats.describe(x=dataset["Income"])
         assert stats.name == "Income"
         assert isinstance(stats.length, int)
@@ -63,34 +48,8 @@ class TestStats:  # pragma: no cover
         assert isinstance(stats.kurtosis, float)
         logging.debug(stats)
 
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
     # ============================================================================================ #
-    def test_categorical(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
+    def test_categorical(self, dataset):
         stats = categorical.CategoricalStats.describe(x=dataset["Education"])
         assert stats.name == "Education"
         assert isinstance(stats.length, int)
@@ -99,18 +58,3 @@ class TestStats:  # pragma: no cover
         assert isinstance(stats.mode, (str, int, float))
         assert isinstance(stats.unique, int)
         logging.debug(stats)
-
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
@@ -16,8 +16,6 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
-import inspect
-from datetime import datetime
 import pytest
 import logging
 import pandas as pd
@@ -30,8 +28,6 @@ from d8analysis.quantitative.inferential.base import StatTestProfileTwo
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
 # ------------------------------------------------------------------------------------------------ #
-double_line = f"\n{100 * '='}"
-single_line = f"\n{100 * '-'}"
 
 
 @pytest.mark.stats
@@ -39,20 +35,8 @@ single_line = f"\n{100 * '-'}"
 @pytest.mark.ttest
 class TestTTest:  # pragma: no cover
     # ============================================================================================ #
-    def test_ttest(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        male = dataset[dataset["Gender"] == "Male"]["Income"]
-        female = dataset[dataset["Gender"] == "Female"]["Income"]
+    def test_ttest(self, gender_income_split):
+        male, female = gender_income_split
         test = TTest(a=male, b=female)
         test.run()
         assert "Independent" in test.result.test
@@ -66,35 +50,9 @@ class TestTTest:  # pragma: no cover
         assert isinstance(test.profile, StatTestProfileTwo)
         logging.debug(test.result)
 
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
     # ============================================================================================ #
-    def test_ttest2(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        female = dataset[dataset["Gender"] == "Female"]["Income"]
+    def test_ttest2(self, gender_income_split):
+        _, female = gender_income_split
         test = TTest(a=female, b=female)
         test.run()
         assert "Independent" in test.result.test
@@ -107,18 +65,3 @@ class TestTTest:  # pragma: no cover
         assert isinstance(test.result.b_stats, ContinuousStats)
         assert isinstance(test.profile, StatTestProfileTwo)
         logging.debug(test.result)
-
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
@@ -16,12 +16,11 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
-import inspect
-from datetime import datetime
 import pytest
 import logging
 import pandas as pd
 import numpy as np
+from scipy import stats
 
 from d8analysis.quantitative.inferential.distribution.kstest import KSTest
 from d8analysis.quantitative.inferential.base import StatTestProfileOne
@@ -29,9 +28,24 @@ from d8analysis.quantitative.inferential.base import StatTestProfileOne
 
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
+
+
 # ------------------------------------------------------------------------------------------------ #
-double_line = f"\n{100 * '='}"
-single_line = f"\n{100 * '-'}"
+@pytest.fixture(scope="class")
+def ks_test():
+    return KSTest()
+
+
+# ------------------------------------------------------------------------------------------------ #
+def assert_ks_result(test: KSTest, a_type: type, b_type: type) -> None:
+    """Asserts the fields common to every KS test result and the types of its two samples."""
+    assert "Kolmogorov" in test.result.test
+    assert isinstance(test.result.H0, str)
+    assert isinstance(test.result.pvalue, float)
+    assert test.result.alpha == 0.05
+    assert isinstance(test.result.a, a_type)
+    assert isinstance(test.result.b, b_type)
+    assert isinstance(test.profile, StatTestProfileOne)
 
 
 @pytest.mark.stats
@@ -39,240 +53,103 @@ single_line = f"\n{100 * '-'}"
 @pytest.mark.kstest
 class TestKSTest:  # pragma: no cover
     # ============================================================================================ #
-    def test_kstest(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        male = dataset[dataset["Gender"] == "Male"]["Income"]
-        female = dataset[dataset["Gender"] == "Female"]["Income"]
-        test = KSTest(a=male, b=female, a_name="Male", b_name="Female")
+    def test_kstest(self, ks_test, gender_income_split):
+        male, female = gender_income_split
+        test = ks_test
+        test.configure(a=male, b=female, a_name="Male", b_name="Female")
         test.run()
-        assert "Kolmogorov" in test.result.test
-        assert isinstance(test.result.H0, str)
-        assert isinstance(test.result.pvalue, float)
-        assert test.result.alpha == 0.05
-        assert isinstance(test.result.a, pd.Series)
-        assert isinstance(test.result.b, pd.Series)
+        assert_ks_result(test, pd.Series, pd.Series)
         assert test.result.a_name == "Male"
         assert test.result.b_name == "Female"
-        assert isinstance(test.profile, StatTestProfileOne)
         logging.debug(test.result)
 
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
     # ============================================================================================ #
-    def test_kstest_norm(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        female = dataset[dataset["Gender"] == "Female"]["Income"].values
-        test = KSTest(a=female, b="norm")
+    @pytest.mark.parametrize("size", [None, 30], ids=["full", "small"])
+    def test_kstest_norm(self, ks_test, female_income, size):
+        test = ks_test
+        test.configure(a=female_income[:size], b="norm")
         test.run()
-        assert "Kolmogorov" in test.result.test
-        assert isinstance(test.result.H0, str)
-        assert isinstance(test.result.pvalue, float)
-        assert test.result.alpha == 0.05
-        assert isinstance(test.result.a, np.ndarray)
-        assert isinstance(test.result.b, str)
-        assert isinstance(test.profile, StatTestProfileOne)
+        assert_ks_result(test, np.ndarray, str)
         logging.debug(test.result)
 
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
     # ============================================================================================ #
-    def test_kstest_small_dataset(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        female = dataset[dataset["Gender"] == "Female"]["Income"].values[0:30]
-        test = KSTest(a=female, b="norm")
+    def test_kstest_large_dataset(self, ks_test, female_income, rng):
+        mu = np.mean(female_income)
+        sigma = np.std(female_income)
+        data = rng.normal(loc=mu, scale=sigma, size=1200)
+        test = ks_test
+        test.configure(a=data, b=female_income)
         test.run()
-        assert "Kolmogorov" in test.result.test
-        assert isinstance(test.result.H0, str)
-        assert isinstance(test.result.pvalue, float)
-        assert test.result.alpha == 0.05
-        assert isinstance(test.result.a, np.ndarray)
-        assert isinstance(test.result.b, str)
-        assert isinstance(test.profile, StatTestProfileOne)
+        assert_ks_result(test, np.ndarray, np.ndarray)
         logging.debug(test.result)
 
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
+    # ============================================================================================ #
+    def test_kstest_invalid_distribution(self, ks_test, female_income):
+        test = ks_test
+        test.configure(a=female_income, b="fake")
+        with pytest.raises(AttributeError):
+            test.run()
 
     # ============================================================================================ #
-    def test_kstest_large_dataset(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        female = dataset[dataset["Gender"] == "Female"]["Income"].values
-        mu = np.mean(female)
-        sigma = np.std(female)
-        data = np.random.normal(loc=mu, scale=sigma, size=1200)
-        test = KSTest(a=data, b=female)
+    def test_kstest_fail_to_reject(self, ks_test, rng):
+        data = rng.normal(size=500)
+        test = ks_test
+        test.configure(a=data, b="norm")
         test.run()
-        assert "Kolmogorov" in test.result.test
-        assert isinstance(test.result.H0, str)
-        assert isinstance(test.result.pvalue, float)
-        assert test.result.alpha == 0.05
-        assert isinstance(test.result.a, np.ndarray)
-        assert isinstance(test.result.b, np.ndarray)
-        assert isinstance(test.profile, StatTestProfileOne)
+        assert_ks_result(test, np.ndarray, str)
+        assert test.result.pvalue > test.result.alpha / 2
         logging.debug(test.result)
 
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
     # ============================================================================================ #
-    def test_kstest_invalid_distribution(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        female = dataset[dataset["Gender"] == "Female"]["Income"].values
-        test = KSTest(a=female, b="fake")
-        with pytest.raises(AttributeError):
-            test.run()
-
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
+    def test_kstest_identical_samples(self, ks_test, female_income):
+        test = ks_test
+        test.configure(a=female_income, b=female_income)
+        test.run()
+        assert test.result.value == 0
+        assert test.result.pvalue == 1
+        logging.debug(test.result)
 
     # ============================================================================================ #
-    def test_kstest_fail_to_reject(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        data = np.random.normal(size=500)
-        test = KSTest(a=data, b="norm")
+    @pytest.mark.parametrize(
+        "n, m", [(20, 25), (30, 30), (12000, 15000)], ids=["exact", "exact_equal", "asymp"]
+    )
+    def test_kstest_integer_samples(self, ks_test, rng, n, m):
+        a = rng.integers(0, 100, size=n)
+        b = rng.integers(0, 100, size=m)
+        expected = stats.ks_2samp(a, b)
+        test = ks_test
+        test.configure(a=a, b=b)
         test.run()
-        assert isinstance(test.result.H0, str)
-        assert isinstance(test.result.pvalue, float)
-        assert test.result.pvalue > test.result.alpha / 2
-        assert test.result.alpha == 0.05
-        assert isinstance(test.result.a, np.ndarray)
-        assert isinstance(test.result.b, str)
-        assert isinstance(test.profile, StatTestProfileOne)
+        assert_ks_result(test, np.ndarray, np.ndarray)
+        assert test.result.value == pytest.approx(expected.statistic, abs=1e-12)
+        assert test.result.pvalue == pytest.approx(expected.pvalue, abs=1e-12)
         logging.debug(test.result)
 
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
+    # ============================================================================================ #
+    @pytest.mark.parametrize(
+        "lam_a, lam_b, n, m",
+        [
+            (20, 20.1, 12000, 15000),
+            (20, 20.1, 10001, 10001),
+            (8, 8.02, 15000, 15000),
+            (50, 50, 11000, 11000),
+        ],
+        ids=["overlapping", "overlapping_equal", "overlapping_small_lambda", "identical"],
+    )
+    def test_kstest_integer_matches_scipy(self, ks_test, rng, lam_a, lam_b, n, m):
+        a = rng.poisson(lam=lam_a, size=n)
+        b = rng.poisson(lam=lam_b, size=m)
+        expected = stats.ks_2samp(a, b)
+        # The samples are drawn so that the pvalue exercises kstwo.sf away from 0 and 1.
+        assert 0.05 < expected.pvalue < 0.95
+        test = ks_test
+        test.configure(a=a, b=b)
+        test.run()
+        assert test.result.value == pytest.approx(expected.statistic, rel=1e-12)
+        assert test.result.pvalue == pytest.approx(expected.pvalue, rel=1e-9)
 
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
+    # ============================================================================================ #
+    def test_kstest_not_configured(self):
+        test = KSTest()
+        with pytest.raises(ValueError, match="configure"):
+            test.run()
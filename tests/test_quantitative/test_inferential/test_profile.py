@@ -16,39 +16,30 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
-import inspect
-from datetime import datetime
 import pytest
+import hashlib
 import logging
 
-from d8analysis.quantitative.inferential.base import StatTestProfileOne
+import pandas as pd
+
+from d8analysis.quantitative.inferential import _stats_data
+from d8analysis.quantitative.inferential.base import (
+    STAT_CONFIG,
+    StatTestProfile,
+    StatTestProfileOne,
+)
 from d8analysis.service.io import IOService
 
 ID = "x2gof"
-PROFILES = "config/stats.yml"
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
 # ------------------------------------------------------------------------------------------------ #
-double_line = f"\n{100 * '='}"
-single_line = f"\n{100 * '-'}"
 
 
 @pytest.mark.profile
 class TestStatProfile:  # pragma: no cover
     # ============================================================================================ #
-    def test_profile(self, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        profiles = IOService.read(PROFILES)
+    def test_profile(self, profiles):
         p = profiles[ID]
         profile = StatTestProfileOne.create(id=ID)
         assert profile.id == ID
@@ -62,20 +53,33 @@ class TestStatProfile:  # pragma: no cover
         assert profile.min_sample_size == p["min_sample_size"]
         assert profile.assumptions == p["assumptions"]
 
-        logger.debug(repr(profile))
+        logger.debug("%r", profile)
         logger.debug(profile)
 
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
+    # ============================================================================================ #
+    def test_compiled_profiles(self, profiles):
+        with open(STAT_CONFIG, "rb") as f:
+            assert _stats_data.SOURCE_DIGEST == hashlib.sha256(f.read()).hexdigest()
+        # Compared as frames so that missing values, read as nan, compare equal.
+        assert pd.DataFrame(_stats_data.STATS).equals(pd.DataFrame(profiles))
+
+    # ============================================================================================ #
+    def test_stale_compiled_profiles(self, profiles, monkeypatch, caplog):
+        reads = []
+        read = IOService.read
+
+        def spy(filepath, *args, **kwargs):
+            reads.append(filepath)
+            return read(filepath, *args, **kwargs)
 
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
+        monkeypatch.setattr(_stats_data, "SOURCE_DIGEST", "stale")
+        monkeypatch.setattr(IOService, "read", spy)
+        StatTestProfile._read_profiles.cache_clear()
+        try:
+            with caplog.at_level(logging.WARNING):
+                loaded = StatTestProfile._read_profiles()
+        finally:
+            StatTestProfile._read_profiles.cache_clear()
+        assert reads == [STAT_CONFIG]
+        assert pd.DataFrame(loaded).equals(pd.DataFrame(profiles))
+        assert "out of date" in caplog.text
@@ -16,11 +16,11 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
-import inspect
-from datetime import datetime
 import pytest
 import logging
 import pandas as pd
+import matplotlib.pyplot as plt
+from scipy import stats
 
 from d8analysis.quantitative.inferential.relational.chisquare import ChiSquareIndependenceTest
 from d8analysis.quantitative.inferential.base import StatTestProfile
@@ -28,9 +28,12 @@ from d8analysis.quantitative.inferential.base import StatTestProfile
 
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
+
+
 # ------------------------------------------------------------------------------------------------ #
-double_line = f"\n{100 * '='}"
-single_line = f"\n{100 * '-'}"
+@pytest.fixture(scope="class")
+def x2_test():
+    return ChiSquareIndependenceTest()
 
 
 @pytest.mark.stats
@@ -38,19 +41,9 @@ single_line = f"\n{100 * '-'}"
 @pytest.mark.x2ind
 class TestX2Independence:  # pragma: no cover
     # ============================================================================================ #
-    def test_x2(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        test = ChiSquareIndependenceTest(data=dataset, a="Education", b="Credit Rating")
+    def test_x2(self, x2_test, dataset):
+        test = x2_test
+        test.configure(data=dataset, a="Education", b="Credit Rating")
         test.run()
         assert "Chi" in test.result.test
         assert isinstance(test.result.H0, str)
@@ -62,17 +55,45 @@ class TestX2Independence:  # pragma: no cover
         assert isinstance(test.result.result, str)
         logging.debug(test.result)
 
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
+    # ============================================================================================ #
+    def test_x2_contingency_table(self, x2_test, education_credit_ct):
+        test = x2_test
+        test.configure(a="Education", b="Credit Rating", contingency_table=education_credit_ct)
+        test.run()
+        statistic, pvalue, dof, _ = stats.chi2_contingency(education_credit_ct)
+        assert test.result.value == statistic
+        assert test.result.pvalue == pvalue
+        assert test.result.dof == dof
+        assert test.result.a == "Education"
+        logging.debug(test.result)
 
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
+    # ============================================================================================ #
+    def test_x2_data_and_contingency_table(self, x2_test, dataset, education_credit_ct):
+        test = x2_test
+        test.configure(
+            data=dataset, a="Education", b="Credit Rating", contingency_table=education_credit_ct
         )
-        logger.info(single_line)
+        with pytest.raises(ValueError, match="not both"):
+            test.run()
+
+    # ============================================================================================ #
+    def test_x2_contingency_table_only(self, x2_test, education_credit_ct):
+        test = x2_test
+        test.configure(contingency_table=education_credit_ct)
+        test.run()
+        statistic, pvalue, dof, _ = stats.chi2_contingency(education_credit_ct)
+        assert test.result.value == statistic
+        assert test.result.pvalue == pvalue
+        assert test.result.data is None
+        assert test.result.a == "rows"
+        assert test.result.b == "columns"
+        assert f"N={education_credit_ct.sum()}" in test.result.result
+        test.result.plot()
+        plt.close("all")
+        logging.debug(test.result)
+
+    # ============================================================================================ #
+    def test_x2_not_configured(self):
+        test = ChiSquareIndependenceTest()
+        with pytest.raises(ValueError, match="configure"):
+            test.run()
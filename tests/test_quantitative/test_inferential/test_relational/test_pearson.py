@@ -16,8 +16,6 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
-import inspect
-from datetime import datetime
 import pytest
 import logging
 
@@ -31,8 +29,6 @@ from d8analysis.quantitative.inferential.base import StatTestProfileTwo
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
 # ------------------------------------------------------------------------------------------------ #
-double_line = f"\n{100 * '='}"
-single_line = f"\n{100 * '-'}"
 
 
 @pytest.mark.stats
@@ -40,19 +36,13 @@ single_line = f"\n{100 * '-'}"
 @pytest.mark.pearson
 class TestPearson:  # pragma: no cover
     # ============================================================================================ #
-    def test_positive(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        test = PearsonCorrelationTest(data=dataset, a="Income", b="Age")
+    @pytest.mark.parametrize(
+        "data, a, b",
+        [("dataset", "Income", "Age"), ("linear_negative_df", "sample a", "sample b")],
+        ids=["positive", "negative"],
+    )
+    def test_pearson(self, data, a, b, request):
+        test = PearsonCorrelationTest(data=request.getfixturevalue(data), a=a, b=b)
         test.run()
         assert "Pearson" in test.result.test
         assert isinstance(test.result.H0, str)
@@ -64,94 +54,17 @@ class TestPearson:  # pragma: no cover
         assert isinstance(test.profile, StatTestProfileTwo)
         logging.debug(test.result)
 
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_negative(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        a = np.linspace(10, 100, 100)
-        b = np.linspace(100, 10, 100)
-        d = {"sample a": a, "sample b": b}
-        df = pd.DataFrame(d)
-        test = PearsonCorrelationTest(data=df, a="sample a", b="sample b")
-        test.run()
-        assert "Pearson" in test.result.test
-        assert isinstance(test.result.H0, str)
-        assert isinstance(test.result.value, float)
-        assert isinstance(test.result.pvalue, float)
-        assert test.result.alpha == 0.05
-        assert isinstance(test.result.result, str)
-        assert isinstance(test.result.data, pd.DataFrame)
-        assert isinstance(test.profile, StatTestProfileTwo)
-        logging.debug(test.result)
-
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
     # ============================================================================================ #
-    def test_invalid_args(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        b = np.linspace(100, 10, 100)
-        test = PearsonCorrelationTest(b=b)
-        with pytest.raises(Exception):
-            test.run()
-
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
+    @pytest.mark.parametrize(
+        "data, a, b, error, match",
+        [
+            (None, None, np.linspace(100, 10, 100), ValueError, "No data to test"),
+            ("linear_negative_df", "no", "way", KeyError, "no is not a valid variable"),
+            ("linear_negative_df", "sample a", None, KeyError, "None is not a valid variable"),
+        ],
+        ids=["no_data", "unknown_columns", "missing_column"],
+    )
+    def test_invalid_args(self, data, a, b, error, match, request):
+        data = request.getfixturevalue(data) if data is not None else None
+        with pytest.raises(error, match=match):
+            PearsonCorrelationTest(data=data, a=a, b=b).run()
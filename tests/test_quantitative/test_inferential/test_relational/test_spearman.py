@@ -16,8 +16,6 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
-import inspect
-from datetime import datetime
 import pytest
 import logging
 import pandas as pd
@@ -29,8 +27,6 @@ from d8analysis.quantitative.inferential.base import StatTestProfileTwo
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
 # ------------------------------------------------------------------------------------------------ #
-double_line = f"\n{100 * '='}"
-single_line = f"\n{100 * '-'}"
 
 
 @pytest.mark.stats
@@ -38,18 +34,7 @@ single_line = f"\n{100 * '-'}"
 @pytest.mark.spearman
 class TestSpearman:  # pragma: no cover
     # ============================================================================================ #
-    def test_spearman(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
+    def test_spearman(self, dataset):
         test = SpearmanCorrelationTest(data=dataset, a="Income", b="Age")
         test.run()
         assert "Spearman" in test.result.test
@@ -61,18 +46,3 @@ class TestSpearman:  # pragma: no cover
         assert isinstance(test.result.data, pd.DataFrame)
         assert isinstance(test.profile, StatTestProfileTwo)
         logging.debug(test.result)
-
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)